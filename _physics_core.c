@@ -0,0 +1,57 @@
+/* Compiled physics core for EV Range Estimator.
+ *
+ * C version of physics_models._compute_range for environments without Numba.
+ * Build in place with:  python setup.py build_ext --inplace
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <math.h>
+
+/* compute_range(rolling_force, mg, drag_k, speed_ms, slope_percent, eff, battery_kwh, usable_pct)
+ *
+ * Returns (estimated range in km, energy consumption in kWh/km).
+ */
+static PyObject *
+compute_range(PyObject *self, PyObject *args)
+{
+    double rolling_force, mg, drag_k, speed_ms, slope_percent, eff, battery_kwh, usable_pct;
+
+    if (!PyArg_ParseTuple(args, "dddddddd", &rolling_force, &mg, &drag_k, &speed_ms,
+                          &slope_percent, &eff, &battery_kwh, &usable_pct)) {
+        return NULL;
+    }
+
+    /* sin(atan(slope_percent / 100)) without the trigonometric calls */
+    double sin_slope = slope_percent / sqrt(slope_percent * slope_percent + 10000.0);
+    double total_force = rolling_force + mg * sin_slope + drag_k * speed_ms * speed_ms;
+    /* (F * v / eff) W over v * 3.6 km/h: speed cancels, leaving F / (eff * 3600) kWh/km */
+    double energy_per_km = total_force / (eff * 3600.0);
+
+    if (energy_per_km == 0.0) {
+        PyErr_SetString(PyExc_ZeroDivisionError, "float division by zero");
+        return NULL;
+    }
+
+    return Py_BuildValue("(dd)", battery_kwh * usable_pct / energy_per_km, energy_per_km);
+}
+
+static PyMethodDef physics_core_methods[] = {
+    {"compute_range", compute_range, METH_VARARGS,
+     "Calculate (range_km, energy_per_km) from precomputed vehicle constants."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef physics_core_module = {
+    PyModuleDef_HEAD_INIT,
+    "_physics_core",
+    "Compiled physics core for EV Range Estimator.",
+    -1,
+    physics_core_methods
+};
+
+PyMODINIT_FUNC
+PyInit__physics_core(void)
+{
+    return PyModule_Create(&physics_core_module);
+}
@@ -4,87 +4,202 @@ This module orchestrates the entire calculation flow by connecting
 user interface, physics calculation, and utility functions.
 """
 
+import argparse
+import csv
+import math
+import sys
+
 import physics_models
 import utils
 import vehicle_data
 import user_interface
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is only required for sweep mode
+    np = None
+
+
+# Input columns for batch mode (efficiency and usable battery as decimals, e.g. 0.88)
+BATCH_COLUMNS = (
+    'battery_capacity',
+    'mass',
+    'drag_coefficient',
+    'frontal_area',
+    'rolling_resistance',
+    'speed_kmh',
+    'slope_percent',
+    'drivetrain_efficiency',
+    'battery_usable_percent',
+)
+
+# Same limits as the interactive prompts (efficiency and usable battery converted from percent to decimals)
+BATCH_LIMITS = {
+    'battery_capacity': user_interface.BATTERY_CAPACITY_LIMITS,
+    'mass': user_interface.MASS_LIMITS,
+    'drag_coefficient': user_interface.DRAG_COEFFICIENT_LIMITS,
+    'frontal_area': user_interface.FRONTAL_AREA_LIMITS,
+    'rolling_resistance': user_interface.ROLLING_RESISTANCE_LIMITS,
+    'speed_kmh': user_interface.SPEED_LIMITS,
+    'slope_percent': user_interface.SLOPE_LIMITS,
+    'drivetrain_efficiency': tuple(limit / 100 for limit in user_interface.DRIVETRAIN_EFFICIENCY_LIMITS),
+    'battery_usable_percent': tuple(limit / 100 for limit in user_interface.BATTERY_USABLE_LIMITS),
+}
+
+
+def _batch_main(csv_in: str, csv_out: str) -> None:
+    """Calculate range for every row of a CSV file without interactive prompts.
+
+    Exits with a non-zero status and an error message if the input cannot be read,
+    is missing columns, or has a non-numeric, non-finite or out-of-range
+    (see BATCH_LIMITS) cell; cell errors name the line.
+
+    Args:
+        csv_in: Path of the input CSV, with a header row naming BATCH_COLUMNS
+        csv_out: Path of the output CSV (input columns plus range_km and energy_per_km)
+    """
+    try:
+        f = open(csv_in, newline="")
+    except OSError as error:
+        sys.exit(f"Error: cannot read {csv_in}: {error.strerror}")
+
+    with f:
+        reader = csv.DictReader(f)
+        missing = [name for name in BATCH_COLUMNS if name not in (reader.fieldnames or [])]
+        if missing:
+            sys.exit(f"Error: {csv_in} is missing columns: {', '.join(missing)}")
+        columns = {name: [] for name in BATCH_COLUMNS}
+        # Original cell text, written back unchanged so the output shows exactly what was computed
+        cells = []
+        for row in reader:
+            cells.append([row[name] for name in BATCH_COLUMNS])
+            for name in BATCH_COLUMNS:
+                try:
+                    value = float(row[name])
+                except (TypeError, ValueError):
+                    sys.exit(f"Error: {csv_in} line {reader.line_num}: {name} must be a number (got {row[name]!r})")
+                if not math.isfinite(value):
+                    sys.exit(f"Error: {csv_in} line {reader.line_num}: {name} must be a finite number (got {value})")
+                low, high = BATCH_LIMITS[name]
+                if not low <= value <= high:
+                    sys.exit(f"Error: {csv_in} line {reader.line_num}: {name} must be between "
+                             f"{low} and {high} (got {value})")
+                columns[name].append(value)
+
+    if np is not None:
+        # One element-wise call over all rows
+        range_km, energy_per_km = physics_models.compute_range_elementwise(
+            **{name: np.array(values) for name, values in columns.items()}
+        )
+    else:
+        results = [
+            physics_models.compute_range_elementwise(*scenario)
+            for scenario in zip(*columns.values())
+        ]
+        range_km = [result[0] for result in results]
+        energy_per_km = [result[1] for result in results]
+
+    with open(csv_out, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(BATCH_COLUMNS + ('range_km', 'energy_per_km'))
+        for row_cells, row_range, row_energy in zip(cells, range_km, energy_per_km):
+            writer.writerow(row_cells + [f"{row_range:.2f}", f"{row_energy:.3f}"])
+
+
+def run_sweep(vehicle_params: physics_models.VehicleParams) -> None:
+    """Calculate and display range over a grid of speeds and slopes.
+
+    Args:
+        vehicle_params: Vehicle specifications from the user interface
+    """
+    sweep_conditions=user_interface.get_sweep_conditions()
+    system_params=user_interface.get_system_parameters()
+
+    speeds_kmh=np.linspace(
+        sweep_conditions['speed_min_kmh'],
+        sweep_conditions['speed_max_kmh'],
+        sweep_conditions['speed_steps'],
+    )
+    slopes_percent=np.linspace(
+        sweep_conditions['slope_min_percent'],
+        sweep_conditions['slope_max_percent'],
+        sweep_conditions['slope_steps'],
+    )
+
+    # CONVERT SI UNITS (m/s)
+    speeds_ms=utils.convert_kmh_to_ms(speeds_kmh)
+
+    range_grid=physics_models.calculate_range_vectorized(
+        speeds_ms=speeds_ms,
+        slopes_percent=slopes_percent,
+        mass=vehicle_params.mass,
+        Crr=vehicle_params.rolling_resistance,
+        Cd=vehicle_params.drag_coefficient,
+        frontal_area=vehicle_params.frontal_area,
+        drivetrain_efficiency=system_params.drivetrain_efficiency,
+        battery_capacity_kwh=vehicle_params.battery_capacity,
+        usable_percent=system_params.battery_usable_percent,
+        g=vehicle_data.GRAVITY,
+        air_density=vehicle_data.AIR_DENSITY,
+    )
+
+    user_interface.display_sweep_results(
+        range_grid=range_grid,
+        speeds_kmh=speeds_kmh,
+        slopes_percent=slopes_percent,
+    )
+
+
 def main():
     """Run the EV Range Estimator main program."""
 
+    parser = argparse.ArgumentParser(description="Estimate electric vehicle range.")
+    parser.add_argument(
+        "--batch",
+        nargs=2,
+        metavar=("CSV_IN", "CSV_OUT"),
+        help="read scenarios from CSV_IN and write results to CSV_OUT instead of prompting",
+    )
+    args = parser.parse_args()
+
+    if args.batch:
+        _batch_main(*args.batch)
+        return
+
     user_interface.display_welcome()
 
     continue_flag = True
 
     while continue_flag:
         # GET ALL INPUTS FROM THE USER
+        mode=user_interface.get_calculation_mode()
+        if mode == "sweep" and np is None:
+            print("Error: Sweep mode requires NumPy, running a single calculation instead")
+            print()
+            mode="single"
 
         vehicle_params=user_interface.get_vehicle_parameters()
-        driving_conditions=user_interface.get_driving_conditions()
-        system_params=user_interface.get_system_parameters()
-
-        # CONVERT SI UNITS (m/s, radians)
-        speed_ms=utils.convert_kmh_to_ms(driving_conditions['speed_kmh'])
-        slope_rad=utils.convert_slope_percent_to_radians(driving_conditions['slope_percent'])
-
-        # CALCULATE RESISTIVE FORCES
-        rolling = physics_models.calculate_rolling_resistance(
-            mass=vehicle_params['mass'],
-            Crr=vehicle_params['rolling_resistance'],
-            g=vehicle_data.GRAVITY,
-        )
-
-        drag = physics_models.calculate_drag_force(
-            speed_ms=speed_ms,
-            Cd=vehicle_params['drag_coefficient'],
-            frontal_area=vehicle_params['frontal_area'],
-            air_density=vehicle_data.AIR_DENSITY
-        )
 
-        gradient=physics_models.calculate_gradient_force(
-            mass=vehicle_params['mass'],
-            slope_angle_rad= slope_rad,
-            g=vehicle_data.GRAVITY,
-        )
-
-        total_force=physics_models.calculate_total_resistance(
-            rolling_force=rolling,
-            drag_force=drag,
-            gradient_force=gradient,
-        )
-
-        # CALCULATE POWER AND ENERGY CONSUMPTION
-        power_wheels=physics_models.calculate_power_at_wheels(
-            total_force=total_force,
-            speed_ms=speed_ms,
-        )
-
-        power_battery=physics_models.calculate_power_from_battery(
-            power_at_wheels=power_wheels,
-            drivetrain_efficiency=system_params['drivetrain_efficiency'],
-        )
+        if mode == "sweep":
+            run_sweep(vehicle_params)
+            continue_flag=user_interface.ask_continue()
+            continue
 
-        energy_per_km=physics_models.calculate_energy_per_km(
-            power_battery_watts=power_battery,
-            speed_ms=speed_ms,
-        )
+        driving_conditions=user_interface.get_driving_conditions()
+        system_params=user_interface.get_system_parameters()
 
         # CALCULATE ESTIMATED RANGE
-        usable_energy=physics_models.calculate_usable_battery_energy(
-            battery_capacity_kwh=vehicle_params['battery_capacity'],
-            usable_percent=system_params['battery_usable_percent'],
-        )
-
-        range_km=physics_models.calculate_range(
-            usable_energy_kwh=usable_energy,
-            energy_per_km=energy_per_km,
+        range_km, energy_per_km=physics_models.compute_range(
+            vehicle_params,
+            driving_conditions,
+            system_params,
         )
 
         # DISPLAY RESULTS
         user_interface.display_results(
             range_km=range_km,
             energy_per_km=energy_per_km,
-            speed_kmh=driving_conditions['speed_kmh'],
+            speed_kmh=driving_conditions.speed_kmh,
         )
 
         # ASK TO CONTINUE
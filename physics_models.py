@@ -4,8 +4,140 @@ This module provides functions for calculating forces, power, energy, and range
 
 """
 
+import functools
 import math
-from utils import convert_ms_to_kmh, convert_watts_to_kwh
+from dataclasses import dataclass, field
+from utils import convert_kmh_to_ms
+from vehicle_data import AIR_DENSITY, GRAVITY
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only required for sweep mode
+    np = None
+
+try:
+    from _physics_core import compute_range as _fast_compute_range
+except ImportError:  # C extension not built (python setup.py build_ext --inplace)
+    _fast_compute_range = None
+
+# Plain range until Numba is loaded; _load_numba swaps in numba.prange for the grid kernel
+_prange = range
+
+
+def _load_numba():
+    """Import Numba on first use so it does not slow down program start-up.
+
+    Returns:
+        The numba module, or None if it is not installed
+    """
+    global _prange
+    try:
+        import numba
+    except ImportError:  # Numba is optional; kernels fall back to plain Python
+        return None
+    _prange = numba.prange
+    return numba
+
+
+def _lazy_njit(func, **options):
+    """Wrap func so it is compiled with numba.njit(**options) on its first call.
+
+    Falls back to calling func directly when Numba is not installed.
+    """
+    compiled = None
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        nonlocal compiled
+        if compiled is None:
+            numba = _load_numba()
+            compiled = numba.njit(**options)(func) if numba is not None else func
+        return compiled(*args, **kwargs)
+
+    return wrapper
+
+
+def _sin(angle):
+    """Sine that keeps scalars on math.sin and only uses np.sin for arrays."""
+    if np is not None and isinstance(angle, np.ndarray):
+        return np.sin(angle)
+    return math.sin(angle)
+
+
+def _sqrt(value):
+    """Square root that keeps scalars on math.sqrt and only uses np.sqrt for arrays."""
+    if np is not None and isinstance(value, np.ndarray):
+        return np.sqrt(value)
+    return math.sqrt(value)
+
+
+@dataclass(slots=True, frozen=True)
+class VehicleParams:
+    """Vehicle specifications.
+
+    The derived force constants are computed once on construction, so the
+    range calculation does not repeat these multiplications on every call.
+
+    Attributes:
+        battery_capacity: Battery capacity in kWh
+        mass: Vehicle mass in kg
+        drag_coefficient: Drag coefficient (dimensionless)
+        frontal_area: Frontal area in m²
+        rolling_resistance: Rolling resistance coefficient (dimensionless)
+        mg: Vehicle weight (mass * g) in Newtons
+        rolling_force: Rolling resistance force (mass * g * Crr) in Newtons
+        drag_k: Drag factor (0.5 * rho * Cd * A) in kg/m
+    """
+    battery_capacity: float
+    mass: float
+    drag_coefficient: float
+    frontal_area: float
+    rolling_resistance: float
+    mg: float = field(init=False, repr=False)
+    rolling_force: float = field(init=False, repr=False)
+    drag_k: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Frozen dataclass: fields must be set through object.__setattr__.
+        # Stored as floats so the compiled kernels see a single signature.
+        for name in ('battery_capacity', 'mass', 'drag_coefficient', 'frontal_area', 'rolling_resistance'):
+            object.__setattr__(self, name, float(getattr(self, name)))
+        object.__setattr__(self, 'mg', self.mass * GRAVITY)
+        object.__setattr__(self, 'rolling_force', self.mg * self.rolling_resistance)
+        object.__setattr__(self, 'drag_k', 0.5 * AIR_DENSITY * self.drag_coefficient * self.frontal_area)
+
+
+@dataclass(slots=True, frozen=True)
+class DrivingConditions:
+    """Driving scenario.
+
+    Attributes:
+        speed_kmh: Driving speed in km/h
+        slope_percent: Road grade as a percentage (e.g., 5 for 5%)
+    """
+    speed_kmh: float
+    slope_percent: float
+
+    def __post_init__(self):
+        # Stored as floats (a slope of 0 would otherwise add a second kernel signature)
+        object.__setattr__(self, 'speed_kmh', float(self.speed_kmh))
+        object.__setattr__(self, 'slope_percent', float(self.slope_percent))
+
+
+@dataclass(slots=True, frozen=True)
+class SystemParams:
+    """Efficiency and battery usage settings (values as decimals, not percentages).
+
+    Attributes:
+        drivetrain_efficiency: Overall efficiency (eg 0.88 / 88%)
+        battery_usable_percent: Usable percent ( e.g. 0.90 , 90%)
+    """
+    drivetrain_efficiency: float
+    battery_usable_percent: float
+
+    def __post_init__(self):
+        object.__setattr__(self, 'drivetrain_efficiency', float(self.drivetrain_efficiency))
+        object.__setattr__(self, 'battery_usable_percent', float(self.battery_usable_percent))
 
 
 def calculate_rolling_resistance(mass: float, Crr: float, g: float = 9.81) -> float:
@@ -26,7 +158,7 @@ def calculate_drag_force(speed_ms: float, Cd: float, frontal_area: float, air_de
     """Calculate Aerodynamic drag force.
 
     Args:
-        speed_ms: Vehicle speed m/s
+        speed_ms: Vehicle speed m/s (float or array)
         Cd: Drag coefficient (dimensionless)
         frontal_area: Frontal_area in m²
         air_density: Air density kg/m³ (default: 1.225)
@@ -35,7 +167,20 @@ def calculate_drag_force(speed_ms: float, Cd: float, frontal_area: float, air_de
         Aerodynamic drag force in Newtons
     """
 
-    return  0.5 * Cd * frontal_area * air_density * speed_ms ** 2
+    return  0.5 * Cd * frontal_area * air_density * speed_ms * speed_ms
+
+
+def calculate_drag_force_pre(drag_k: float, speed_ms: float) -> float:
+    """Calculate Aerodynamic drag force from a precomputed drag factor.
+
+    Args:
+        drag_k: Drag factor 0.5 * air_density * Cd * frontal_area in kg/m
+        speed_ms: Vehicle speed m/s (float or array)
+
+    Returns:
+        Aerodynamic drag force in Newtons
+    """
+    return drag_k * speed_ms * speed_ms
 
 
 def calculate_gradient_force(mass: float, slope_angle_rad: float, g: float = 9.81) -> float:
@@ -43,14 +188,31 @@ def calculate_gradient_force(mass: float, slope_angle_rad: float, g: float = 9.8
 
     Args:
         mass: Vehicle mass in kg
-        slope_angle_rad: Slope angle in radians
+        slope_angle_rad: Slope angle in radians (float or array)
+        g: Gravitational acceleration in m/s² (default: 9.81)
+
+    Returns:
+        gradient force in Newtons (Positive = Uphill , Negative = Downhill)
+    """
+
+    return mass * g * _sin(slope_angle_rad)
+
+
+def gradient_force_from_percent(mass: float, slope_percent: float, g: float = 9.81) -> float:
+    """Calculate gradient/ slope resistance force directly from the slope percentage.
+
+    Uses sin(atan(t)) = t / sqrt(1 + t²), so no trigonometric functions are needed.
+
+    Args:
+        mass: Vehicle mass in kg
+        slope_percent: Road grade as a percentage (float or array)
         g: Gravitational acceleration in m/s² (default: 9.81)
 
     Returns:
         gradient force in Newtons (Positive = Uphill , Negative = Downhill)
     """
 
-    return mass * g * math.sin(slope_angle_rad)
+    return mass * g * slope_percent / _sqrt(slope_percent * slope_percent + 10000.0)
 
 def calculate_total_resistance(rolling_force: float, drag_force: float, gradient_force: float) -> float:
     """Calculate total resistive forces acting on the vehicle.
@@ -93,20 +255,17 @@ def calculate_power_from_battery(power_at_wheels: float, drivetrain_efficiency:
     return power_at_wheels / drivetrain_efficiency
 
 
-def calculate_energy_per_km(power_battery_watts: float, speed_ms: float) -> float:
+def calculate_energy_per_km(power_battery_watts: float, speed_kmh: float) -> float:
     """Calculate energy consumption per kilometer (kWh)
 
     Args:
         power_battery_watts: Battery power in Watts (W)
-        speed_ms: Vehicle speed (m/s)
+        speed_kmh: Vehicle speed (km/h)
 
     Returns:
         Energy consumption in kWh/km
     """
-    power_kwh = convert_watts_to_kwh(power_battery_watts)
-    speed_km = convert_ms_to_kmh(speed_ms)
-
-    return power_kwh / speed_km
+    return power_battery_watts / 1000.0 / speed_kmh
 
 
 def calculate_usable_battery_energy(battery_capacity_kwh: float, usable_percent: float) -> float:
@@ -135,3 +294,215 @@ def calculate_range(usable_energy_kwh: float, energy_per_km: float) -> float:
     return usable_energy_kwh / energy_per_km
 
 
+def _compute_range(rolling_force: float, mg: float, drag_k: float, speed_ms: float, slope_percent: float,
+                   eff: float, battery_kwh: float, usable_pct: float) -> tuple:
+    """Calculate estimated range in one fused expression.
+
+    Combines rolling, drag and gradient forces, battery power, energy per km and
+    range so a single call replaces the chain of calculate_* functions. Uses only
+    arithmetic, so it also works element-wise on NumPy arrays.
+
+    Args:
+        rolling_force: Rolling resistance force (mass * g * Crr) in Newtons
+        mg: Vehicle weight (mass * g) in Newtons
+        drag_k: Drag factor (0.5 * rho * Cd * A) in kg/m
+        speed_ms: Vehicle speed (m/s)
+        slope_percent: Road grade as a percentage (e.g., 5 for 5%)
+        eff: Drivetrain efficiency (eg 0.88 / 88%)
+        battery_kwh: Battery capacity in kWh
+        usable_pct: Usable percent ( e.g. 0.90 , 90%)
+
+    Returns:
+        Tuple of (estimated range in km, energy consumption in kWh/km)
+
+    Examples:
+        >>> mg = 2200 * 9.81
+        >>> range_km, energy_per_km = _compute_range(mg * 0.012, mg, 0.5 * 1.225 * 0.32 * 2.8,
+        ...                                          100 / 3.6, 3.0, 0.88, 80.0, 0.9)
+        >>> round(range_km, 2), round(energy_per_km, 3)
+        (171.55, 0.42)
+    """
+    # sin(atan(slope_percent / 100)) without the trigonometric calls
+    sin_slope = slope_percent / (slope_percent * slope_percent + 10000.0) ** 0.5
+    total_force = rolling_force + mg * sin_slope + drag_k * speed_ms * speed_ms
+    # (F * v / eff) W over v * 3.6 km/h: speed cancels, leaving F / (eff * 3600) kWh/km
+    energy_per_km = total_force / (eff * 3600.0)
+
+    return battery_kwh * usable_pct / energy_per_km, energy_per_km
+
+
+# Prefer the prebuilt C extension, then Numba (compiled on first use and cached on
+# disk with cache=True so later runs skip the JIT step), then plain Python
+if _fast_compute_range is not None:
+    _range_kernel = _fast_compute_range
+else:
+    _range_kernel = _lazy_njit(_compute_range, cache=True, fastmath=True)
+
+
+def compute_range(vehicle_params: VehicleParams, driving_conditions: DrivingConditions,
+                  system_params: SystemParams) -> tuple:
+    """Calculate estimated range directly from the user interface parameters.
+
+    The granular calculate_* functions remain available; this is the fused path
+    used by the main program.
+
+    Args:
+        vehicle_params: Vehicle specifications
+        driving_conditions: Driving speed and slope
+        system_params: Drivetrain efficiency and usable battery fraction
+
+    Returns:
+        Tuple of (estimated range in km, energy consumption in kWh/km)
+
+    Examples:
+        >>> vehicle = VehicleParams(80, 2200, 0.32, 2.8, 0.012)
+        >>> range_km, energy_per_km = compute_range(vehicle, DrivingConditions(100, 3), SystemParams(0.88, 0.9))
+        >>> round(range_km, 2), round(energy_per_km, 3)
+        (171.55, 0.42)
+    """
+    return _range_kernel(
+        vehicle_params.rolling_force,
+        vehicle_params.mg,
+        vehicle_params.drag_k,
+        convert_kmh_to_ms(driving_conditions.speed_kmh),
+        driving_conditions.slope_percent,
+        system_params.drivetrain_efficiency,
+        vehicle_params.battery_capacity,
+        system_params.battery_usable_percent,
+    )
+
+
+def compute_range_elementwise(battery_capacity, mass, drag_coefficient, frontal_area, rolling_resistance,
+                              speed_kmh, slope_percent, drivetrain_efficiency, battery_usable_percent) -> tuple:
+    """Calculate estimated range element-wise for many independent scenarios.
+
+    Every argument may be a float or an array; arrays are combined element by
+    element (NumPy broadcasting), so one call evaluates a whole batch.
+
+    Args:
+        battery_capacity: Battery capacity in kWh
+        mass: Vehicle mass in kg
+        drag_coefficient: Drag coefficient (dimensionless)
+        frontal_area: Frontal area in m²
+        rolling_resistance: Rolling resistance coefficient (dimensionless)
+        speed_kmh: Driving speed in km/h
+        slope_percent: Road grade as a percentage (e.g., 5 for 5%)
+        drivetrain_efficiency: Overall efficiency (eg 0.88 / 88%)
+        battery_usable_percent: Usable percent ( e.g. 0.90 , 90%)
+
+    Returns:
+        Tuple of (estimated range in km, energy consumption in kWh/km)
+
+    Examples:
+        >>> range_km, energy_per_km = compute_range_elementwise(80, 2200, 0.32, 2.8, 0.012, 100, 3, 0.88, 0.9)
+        >>> round(range_km, 2), round(energy_per_km, 3)
+        (171.55, 0.42)
+    """
+    mg = mass * GRAVITY
+
+    return _compute_range(
+        mg * rolling_resistance,
+        mg,
+        0.5 * AIR_DENSITY * drag_coefficient * frontal_area,
+        convert_kmh_to_ms(speed_kmh),
+        slope_percent,
+        drivetrain_efficiency,
+        battery_capacity,
+        battery_usable_percent,
+    )
+
+
+def calculate_range_vectorized(speeds_ms, slopes_percent, mass: float, Crr: float, Cd: float,
+                               frontal_area: float, drivetrain_efficiency: float,
+                               battery_capacity_kwh: float, usable_percent: float,
+                               g: float = 9.81, air_density: float = 1.225):
+    """Calculate estimated range over a grid of speeds and slopes in one pass.
+
+    Args:
+        speeds_ms: 1-D array of vehicle speeds in m/s
+        slopes_percent: 1-D array of road grades as percentages
+        mass: Vehicle mass in kg
+        Crr: Rolling resistance coefficient (dimensionless)
+        Cd: Drag coefficient (dimensionless)
+        frontal_area: Frontal area in m²
+        drivetrain_efficiency: Overall efficiency (eg 0.88 / 88%)
+        battery_capacity_kwh: Battery capacity in kWh
+        usable_percent: Usable percent ( e.g. 0.90 , 90%)
+        g: Gravitational acceleration in m/s² (default: 9.81)
+        air_density: Air density kg/m³ (default: 1.225)
+
+    Returns:
+        2-D array of estimated range in kilometers, shape (len(speeds_ms), len(slopes_percent))
+
+    Examples:
+        >>> grid = calculate_range_vectorized([100 / 3.6], [3.0], 2200, 0.012, 0.32, 2.8, 0.88, 80, 0.9)
+        >>> round(float(grid[0, 0]), 2)
+        171.55
+    """
+    if np is None:
+        raise ImportError("NumPy is required for vectorized range calculations")
+
+    # Speeds run along rows, slopes along columns
+    speed = np.asarray(speeds_ms, dtype=float)[:, np.newaxis]
+    slope = np.asarray(slopes_percent, dtype=float)[np.newaxis, :]
+
+    rolling = calculate_rolling_resistance(mass, Crr, g)
+    drag = calculate_drag_force_pre(0.5 * air_density * Cd * frontal_area, speed)
+    gradient = gradient_force_from_percent(mass, slope, g)
+
+    # (F * v / eff) W over v * 3.6 km/h: speed cancels, leaving F / (eff * 3600) kWh/km
+    energy_per_km = (rolling + drag + gradient) / (drivetrain_efficiency * 3600.0)
+
+    return calculate_usable_battery_energy(battery_capacity_kwh, usable_percent) / energy_per_km
+
+
+def _range_grid(speeds_ms, slopes_rad, mass: float, Crr: float, Cd: float, A: float, eff: float,
+                batt_kwh: float, usable: float, g: float = 9.81, rho: float = 1.225):
+    """Calculate estimated range for every (speed, slope) pair with explicit loops.
+
+    Unlike calculate_range_vectorized, which takes slopes_percent, this kernel
+    takes the slopes as angles in radians (math.atan(percent / 100)).
+
+    Args:
+        speeds_ms: 1-D array of vehicle speeds in m/s
+        slopes_rad: 1-D array of slope angles in radians (not percentages)
+        mass: Vehicle mass in kg
+        Crr: Rolling resistance coefficient (dimensionless)
+        Cd: Drag coefficient (dimensionless)
+        A: Frontal area in m²
+        eff: Drivetrain efficiency (eg 0.88 / 88%)
+        batt_kwh: Battery capacity in kWh
+        usable: Usable percent ( e.g. 0.90 , 90%)
+        g: Gravitational acceleration in m/s² (default: 9.81)
+        rho: Air density kg/m³ (default: 1.225)
+
+    Returns:
+        2-D array of estimated range in kilometers, shape (speeds_ms.size, slopes_rad.size)
+
+    Examples:
+        >>> grid = range_grid_njit(np.array([100 / 3.6]), np.array([math.atan(0.03)]),
+        ...                        2200.0, 0.012, 0.32, 2.8, 0.88, 80.0, 0.9)
+        >>> round(float(grid[0, 0]), 2)
+        171.55
+    """
+    if np is None:
+        raise ImportError("NumPy is required for vectorized range calculations")
+
+    out = np.empty((speeds_ms.size, slopes_rad.size))
+    mg = mass * g
+    rolling_force = mg * Crr
+    drag_k = 0.5 * rho * Cd * A
+    usable_energy = batt_kwh * usable
+
+    for i in _prange(speeds_ms.size):
+        drag_force = drag_k * speeds_ms[i] * speeds_ms[i]
+        for j in range(slopes_rad.size):
+            total_force = rolling_force + drag_force + mg * math.sin(slopes_rad[j])
+            out[i, j] = usable_energy * eff * 3600.0 / total_force
+
+    return out
+
+
+# Parallel across CPU cores. The first call compiles the kernel (around a second);
+# cache=True stores the result on disk so later runs reuse it.
+range_grid_njit = _lazy_njit(_range_grid, parallel=True, fastmath=True, cache=True)
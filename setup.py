@@ -0,0 +1,18 @@
+"""Build script for the optional compiled physics core.
+
+Build in place with:
+    python setup.py build_ext --inplace
+
+or install the program modules together with the extension with:
+    pip install .
+
+Without the extension, physics_models falls back to Numba or plain Python.
+"""
+
+from setuptools import Extension, setup
+
+setup(
+    name="ev-range-estimator",
+    py_modules=["main", "physics_models", "user_interface", "utils", "vehicle_data"],
+    ext_modules=[Extension("_physics_core", sources=["_physics_core.c"])],
+)
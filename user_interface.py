@@ -2,21 +2,53 @@
 This module handles all user interactions including input collection and result display.
 """
 
+import re
+
+from physics_models import DrivingConditions, SystemParams, VehicleParams
+from utils import make_validator
+from vehicle_data import COMPACT_EV, SUV_EV, SPORTS_EV
+
+# Preset profiles in menu order, indexed by int(choice) - 1
+_PRESETS = (COMPACT_EV, SUV_EV, SPORTS_EV)
+
+# Plain decimal or scientific notation; anything else is rejected before float()
+_NUMERIC_RE = re.compile(r'^[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?$')
+
+_SEP = "=" * 50
+
+# Accepted input ranges (also enforced by main.py batch mode)
+BATTERY_CAPACITY_LIMITS = (10, 200)  # kWh
+MASS_LIMITS = (800, 3000)  # kg
+DRAG_COEFFICIENT_LIMITS = (0.15, 0.50)  # Cd
+FRONTAL_AREA_LIMITS = (1.5, 4.0)  # m²
+ROLLING_RESISTANCE_LIMITS = (0.005, 0.020)  # Crr
+SPEED_LIMITS = (10, 200)  # km/h
+SLOPE_LIMITS = (-15, 15)  # %
+DRIVETRAIN_EFFICIENCY_LIMITS = (70, 98)  # %
+BATTERY_USABLE_LIMITS = (70, 100)  # %
+
+_YES = frozenset({"yes", "y"})
+_NO = frozenset({"no", "n"})
+
+_WELCOME_TEXT = "\n".join([
+    _SEP,
+    "EV Range Estimator v1.0",
+    _SEP,
+    "",
+    "This program estimates electric vehicle range based on:",
+    "- Vehicle specifications (mass, aerodynamics)",
+    "- Driving conditions (speed, road slope)",
+    "- Battery capacity and efficiency",
+    "",
+    "Let's gather the necessary information...",
+    "",
+])
+
 
 def display_welcome() -> None:
     """Display welcome message and program description."""
 
-    print("=" * 50)
-    print("EV Range Estimator v1.0")
-    print("=" * 50)
-    print()
-    print("This program estimates electric vehicle range based on:")
-    print("- Vehicle specifications (mass, aerodynamics)")
-    print("- Driving conditions (speed, road slope)")
-    print("- Battery capacity and efficiency")
-    print()
-    print("Let's gather the necessary information...")
-    print()
+    print(_WELCOME_TEXT)
 
 def get_user_input(prompt:str, min_value:float=None, max_value:float=None, default_value:float=None) -> float:
     """Get validated numeric input from user.
@@ -30,32 +62,75 @@ def get_user_input(prompt:str, min_value:float=None, max_value:float=None, defau
         valid float number from the user
     """
 
+    validator = make_validator(min_value, max_value)
+
     while True:
-        user_input = input(prompt)
+        user_input = input(prompt).strip()
         if user_input == "" and default_value is not None:
             return default_value
-        try:
-            value = float(user_input)
-            if min_value is not None and value < min_value:
-                print(f"Error: Value must be at least {min_value}")
-                continue
-            if max_value is not None and value > max_value:
-                print(f"Error: Value must be at most {max_value}")
-                continue
-
-            return value
-        except ValueError:
+        if not _NUMERIC_RE.match(user_input):
             print("Error: Please enter a numeric value")
+            continue
+
+        value = float(user_input)
+        error = validator(value)
+        if error is not None:
+            print(error)
+            continue
+
+        return value
+
 
+def get_integer_input(prompt:str, min_value:int=None, max_value:int=None, default_value:int=None) -> int:
+    """Get validated whole-number input from user.
+    Args:
+        prompt: message to display to user
+        min_value: Minimum acceptable value (optional)
+        max_value: Maximum acceptable value (optional)
+        default_value: Default if user presses 'enter' (optional)
+
+    Returns:
+        valid integer from the user
+    """
+
+    while True:
+        value = get_user_input(prompt, min_value=min_value, max_value=max_value, default_value=default_value)
+        if value == int(value):
+            return int(value)
+        print("Error: Please enter a whole number")
+
+
+def get_calculation_mode() -> str:
+    """Ask user whether to run a single calculation or a parameter sweep.
+
+    Returns:
+        "single" or "sweep"
+    """
+    print("--- Calculation Mode ---")
+    print()
+    print(" 1. Single calculation")
+    print(" 2. Sweep mode (range over a grid of speeds and slopes)")
+    print()
+
+    while True:
+        choice = input("Enter choice 1 or 2 ")
+
+        if choice == "1":
+            return "single"
+        elif choice == "2":
+            return "sweep"
+        else:
+            print("Error: Please enter 1 or 2")
 
-def get_vehicle_parameters() -> dict:
+
+def get_vehicle_parameters() -> VehicleParams:
    """Collect Vehicle specifications from user.
 
     User can choose between predefined vehicle profiles or enter custom specifications.
 
     Returns:
-        Dictionary with keys: battery_capacity, mass, drag_coefficient, frontal_area,
-        rolling resistance
+        VehicleParams with battery_capacity, mass, drag_coefficient, frontal_area,
+        rolling_resistance
    """
    print("--- Vehicle Specifications ---")
    print()
@@ -74,14 +149,12 @@ def get_vehicle_parameters() -> dict:
        else:
            print("Error: Please enter 1 or 2")
 
-def _get_preset_vehicle() -> dict:
+def _get_preset_vehicle() -> VehicleParams:
     """Let user select form predefined vehicle profiles.
 
     Returns:
-        Dictionary wih vehicle specification from preset
+        VehicleParams with vehicle specification from preset
     """
-    from vehicle_data import COMPACT_EV, SUV_EV, SPORTS_EV
-
     print()
     print("Available vehicle presets:")
     print(f" 1. {COMPACT_EV['name']}")
@@ -92,17 +165,10 @@ def _get_preset_vehicle() -> dict:
     while True:
         choice = input("Select vehicle (1-3) ")
 
-        if choice == "1":
-            selected = COMPACT_EV
-            break
-        elif choice == "2":
-            selected = SUV_EV
-            break
-        elif choice == "3":
-            selected = SPORTS_EV
+        if choice in {"1", "2", "3"}:
+            selected = _PRESETS[int(choice) - 1]
             break
-        else:
-            print("Error: Please enter 1, 2 or 3")
+        print("Error: Please enter 1, 2 or 3")
 
     print()
     print(f"Selected: {selected['name']}")
@@ -110,64 +176,100 @@ def _get_preset_vehicle() -> dict:
     print(f" Battery: {selected['battery_capacity']} kWh")
     print()
 
-    return selected
+    return VehicleParams(
+        battery_capacity=selected['battery_capacity'],
+        mass=selected['mass'],
+        drag_coefficient=selected['drag_coefficient'],
+        frontal_area=selected['frontal_area'],
+        rolling_resistance=selected['rolling_resistance'],
+    )
 
-def _get_custom_vehicle() -> dict:
+def _get_custom_vehicle() -> VehicleParams:
     """Get custom vehicle specification from user input.
 
     Returns:
-        Dictionary with vehicle specifications
+        VehicleParams with vehicle specifications
     """
     print()
     print("Enter custom vehicle specification")
     print()
 
-    battery = get_user_input("Enter battery capacity (kWh): ", min_value=10, max_value=200)
-    mass = get_user_input("Enter vehicle mass (kg): ", min_value=800, max_value=3000)
-    cd = get_user_input("Enter drag coefficient (Cd): ", min_value=0.15, max_value=0.50, default_value=0.28)
-    area = get_user_input("Enter frontal area (m²): ", min_value=1.5, max_value=4.0, default_value=2.2)
-    crr = get_user_input("Enter rolling resistance (Crr): ", min_value=0.005, max_value=0.020, default_value=0.010)
+    battery = get_user_input("Enter battery capacity (kWh): ", min_value=BATTERY_CAPACITY_LIMITS[0], max_value=BATTERY_CAPACITY_LIMITS[1])
+    mass = get_user_input("Enter vehicle mass (kg): ", min_value=MASS_LIMITS[0], max_value=MASS_LIMITS[1])
+    cd = get_user_input("Enter drag coefficient (Cd): ", min_value=DRAG_COEFFICIENT_LIMITS[0], max_value=DRAG_COEFFICIENT_LIMITS[1], default_value=0.28)
+    area = get_user_input("Enter frontal area (m²): ", min_value=FRONTAL_AREA_LIMITS[0], max_value=FRONTAL_AREA_LIMITS[1], default_value=2.2)
+    crr = get_user_input("Enter rolling resistance (Crr): ", min_value=ROLLING_RESISTANCE_LIMITS[0], max_value=ROLLING_RESISTANCE_LIMITS[1], default_value=0.010)
 
     print()
 
-    return {
-        'battery_capacity': battery,
-        'mass': mass,
-        'drag_coefficient': cd,
-        'frontal_area': area,
-        'rolling_resistance': crr
-    }
+    return VehicleParams(
+        battery_capacity=battery,
+        mass=mass,
+        drag_coefficient=cd,
+        frontal_area=area,
+        rolling_resistance=crr,
+    )
 
-def get_driving_conditions() -> dict:
+def get_driving_conditions() -> DrivingConditions:
     """Collect driving scenario information from user.
 
     Returns:
-        Dictionary with keys: speed_kmh, slope_percent
+        DrivingConditions with speed_kmh, slope_percent
     """
 
     print("--- Driving Conditions ---")
     print()
 
-    speed_kmh = get_user_input("Enter speed (km/h): ", min_value=10, max_value=200)
+    speed_kmh = get_user_input("Enter speed (km/h): ", min_value=SPEED_LIMITS[0], max_value=SPEED_LIMITS[1])
 
     print("Road slope options:")
     print(" - Enter 0 for flat road")
     print(" - Enter a positive number for uphill (e.g., 5 for 5%)")
     print(" - Enter a negative number for downhill (e.g., -3 for -3% )")
 
-    slope_percent = get_user_input("Enter slope percentage (%): ", min_value=-15, max_value=15, default_value=0)
+    slope_percent = get_user_input("Enter slope percentage (%): ", min_value=SLOPE_LIMITS[0], max_value=SLOPE_LIMITS[1], default_value=0)
+
+    print()
+
+    return DrivingConditions(
+        speed_kmh=speed_kmh,
+        slope_percent=slope_percent,
+    )
+
+def get_sweep_conditions() -> dict:
+    """Collect speed and slope ranges for a sweep from user.
+
+    Returns:
+        Dictionary with keys: speed_min_kmh, speed_max_kmh, speed_steps,
+        slope_min_percent, slope_max_percent, slope_steps
+    """
+
+    print("--- Sweep Conditions ---")
+    print()
+
+    speed_min = get_user_input("Enter minimum speed (km/h): ", min_value=SPEED_LIMITS[0], max_value=SPEED_LIMITS[1], default_value=30)
+    speed_max = get_user_input("Enter maximum speed (km/h): ", min_value=speed_min, max_value=SPEED_LIMITS[1], default_value=max(speed_min, 130))
+    speed_steps = get_integer_input("Enter number of speed steps: ", min_value=1, max_value=50, default_value=6)
+
+    slope_min = get_user_input("Enter minimum slope percentage (%): ", min_value=SLOPE_LIMITS[0], max_value=SLOPE_LIMITS[1], default_value=-5)
+    slope_max = get_user_input("Enter maximum slope percentage (%): ", min_value=slope_min, max_value=SLOPE_LIMITS[1], default_value=max(slope_min, 5))
+    slope_steps = get_integer_input("Enter number of slope steps: ", min_value=1, max_value=20, default_value=5)
 
     print()
 
     return {
-        'speed_kmh': speed_kmh,
-        'slope_percent': slope_percent,
+        'speed_min_kmh': speed_min,
+        'speed_max_kmh': speed_max,
+        'speed_steps': speed_steps,
+        'slope_min_percent': slope_min,
+        'slope_max_percent': slope_max,
+        'slope_steps': slope_steps,
     }
 
-def get_system_parameters() -> dict:
+def get_system_parameters() -> SystemParams:
     """Get efficiency and battery usage settings.
     Returns:
-        Dictionary with keys: drivetrain_efficiency, battery_usable_percent
+        SystemParams with drivetrain_efficiency, battery_usable_percent
         (values as decimals, not percentages)
     """
 
@@ -175,15 +277,15 @@ def get_system_parameters() -> dict:
     print("Press Enter to use the default values")
     print()
 
-    efficiency = get_user_input("Enter drivetrain efficiency (%, default 88): ", min_value=70, max_value=98, default_value=88)
-    usable = get_user_input("Enter battery usable percentage (%): ", min_value=70, max_value=100, default_value=90)
+    efficiency = get_user_input("Enter drivetrain efficiency (%, default 88): ", min_value=DRIVETRAIN_EFFICIENCY_LIMITS[0], max_value=DRIVETRAIN_EFFICIENCY_LIMITS[1], default_value=88)
+    usable = get_user_input("Enter battery usable percentage (%): ", min_value=BATTERY_USABLE_LIMITS[0], max_value=BATTERY_USABLE_LIMITS[1], default_value=90)
 
     print()
 
-    return {
-        'drivetrain_efficiency': efficiency / 100,
-        'battery_usable_percent': usable / 100,
-    }
+    return SystemParams(
+        drivetrain_efficiency=efficiency / 100,
+        battery_usable_percent=usable / 100,
+    )
 
 def display_results(range_km: float, energy_per_km: float, speed_kmh: float) -> None :
     """Display calculation results to user.
@@ -194,17 +296,39 @@ def display_results(range_km: float, energy_per_km: float, speed_kmh: float) ->
         speed_kmh: Driving speed in km/h
     """
 
-    print()
-    print("=" * 50)
-    print("RESULTS")
-    print("=" * 50)
-    print()
-    print(f"Estimated range: {range_km:.2f} km")
-    print(f"Energy consumption: {energy_per_km:.3f} kWh/km")
-    print(f"Driving speed: {speed_kmh:.0f} km/h")
-    print()
-    print("=" * 50)
-    print()
+    print(
+        f"\n{_SEP}\n"
+        "RESULTS\n"
+        f"{_SEP}\n"
+        "\n"
+        f"Estimated range: {range_km:.2f} km\n"
+        f"Energy consumption: {energy_per_km:.3f} kWh/km\n"
+        f"Driving speed: {speed_kmh:.0f} km/h\n"
+        "\n"
+        f"{_SEP}\n"
+    )
+
+def display_sweep_results(range_grid, speeds_kmh, slopes_percent) -> None:
+    """Display a grid of sweep results to user.
+
+    Args:
+        range_grid: 2-D array of estimated range in km (rows = speeds, columns = slopes)
+        speeds_kmh: Speeds in km/h for each row
+        slopes_percent: Slopes in % for each column
+    """
+
+    lines = [
+        "",
+        _SEP,
+        "SWEEP RESULTS (estimated range in km)",
+        _SEP,
+        "",
+        "Speed / Slope " + "".join(f"{slope:>9.1f}%" for slope in slopes_percent),
+    ]
+    for speed, row in zip(speeds_kmh, range_grid):
+        lines.append(f"{speed:>8.0f} km/h " + "".join(f"{value:>10.1f}" for value in row))
+    lines += ["", _SEP, ""]
+    print("\n".join(lines))
 
 def ask_continue() -> bool:
     """Ask user if they want to continue calculation.
@@ -214,13 +338,12 @@ def ask_continue() -> bool:
     """
 
     while True:
-        response = input("Do you want to run another calculation (yes/no): ")
-        response_lower = response.lower()
+        response = input("Do you want to run another calculation (yes/no): ").strip().casefold()
 
-        if response_lower in ["yes", "y"]:
+        if response in _YES:
             return True
 
-        if response_lower in ["no", "n"]:
+        if response in _NO:
             return False
 
         print("Please enter yes or no.")
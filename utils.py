@@ -6,6 +6,10 @@ This module provides conversion functions between different units used in the EV
 import math
 
 
+# Slope angles for every whole percent accepted by the user interface (-15% to 15%)
+_SLOPE_LUT = {percent: math.atan(percent / 100) for percent in range(-15, 16)}
+
+
 def convert_kmh_to_ms(speed_kmh: float) -> float:
     """Converts speed from kilometers per hour to meters per second.
 
@@ -50,8 +54,49 @@ def convert_slope_percent_to_radians(slope_percent: float) -> float:
         Slope angle in radians (for use in sin/cos functions)
 
     """
+    slope_rad = _SLOPE_LUT.get(slope_percent)
+    if slope_rad is not None:
+        return slope_rad
     return math.atan(slope_percent / 100)
 
+def make_validator(min_value: float = None, max_value: float = None):
+    """Build a range check specialised for the given bounds.
+
+    The bounds are inspected once here, so the returned function does not
+    re-check which limits are set on every call.
+
+    Args:
+        min_value: Minimum acceptable value (optional)
+        max_value: Maximum acceptable value (optional)
+
+    Returns:
+        Function taking a value and returning an error message, or None if the value is valid
+    """
+    if min_value is not None and max_value is not None:
+        def _bounded(value: float):
+            if value < min_value:
+                return f"Error: Value must be at least {min_value}"
+            if value > max_value:
+                return f"Error: Value must be at most {max_value}"
+            return None
+        return _bounded
+    elif min_value is not None:
+        def _min_only(value: float):
+            if value < min_value:
+                return f"Error: Value must be at least {min_value}"
+            return None
+        return _min_only
+    elif max_value is not None:
+        def _max_only(value: float):
+            if value > max_value:
+                return f"Error: Value must be at most {max_value}"
+            return None
+        return _max_only
+    else:
+        def _unbounded(value: float):
+            return None
+        return _unbounded
+
 def validate_positive_number(value: float, parameter_name: str) -> bool:
     """Check if a number is positive.
 